@@ -1,12 +1,17 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from motor.motor_asyncio import AsyncIOMotorClient
+from cachetools import TTLCache
 from typing import List, Optional
+import asyncio
+import re
 import uuid
 import os
 from datetime import datetime, date, timezone, timedelta
+from pymongo import ReturnDocument, UpdateMany, UpdateOne
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -14,10 +19,30 @@ load_dotenv()
 
 # MongoDB setup
 MONGO_URL = os.getenv("MONGO_URL")
-client = AsyncIOMotorClient(MONGO_URL)
+client = AsyncIOMotorClient(
+    MONGO_URL,
+    maxPoolSize=50,
+    minPoolSize=10,
+    maxIdleTimeMS=30000,
+    compressors="zstd,zlib",
+    retryWrites=True,
+    serverSelectionTimeoutMS=3000
+)
 db = client.capital_health_inventory
 
-app = FastAPI(title="СтолицаЗдоровья - Inventory Management")
+# Dashboard stats cache; writes invalidate it, the TTL bounds staleness otherwise
+STATS_CACHE_TTL = int(os.getenv("STATS_CACHE_TTL", "60"))
+stats_cache = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL)
+stats_lock = asyncio.Lock()
+stats_generation = 0  # Bumped by every invalidation, so results computed before a write are discarded
+
+# How often stored item statuses are refreshed for expiry-date transitions
+STATUS_SWEEP_INTERVAL = int(os.getenv("STATUS_SWEEP_INTERVAL", "300"))
+
+# Test-only routes such as /api/test/reset; keep disabled outside test deployments
+ENABLE_TEST_ENDPOINTS = os.getenv("ENABLE_TEST_ENDPOINTS", "").lower() in ("1", "true", "yes")
+
+app = FastAPI(title="СтолицаЗдоровья - Inventory Management", default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -30,7 +55,7 @@ app.add_middleware(
 
 # Pydantic models
 class InventoryItem(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     category: str  # "medication", "equipment", "consumable"
     quantity: int
@@ -38,15 +63,25 @@ class InventoryItem(BaseModel):
     manufacturer: Optional[str] = None
     batch_number: Optional[str] = None
     expiry_date: Optional[str] = None  # ISO format date string
-    purchase_date: str = Field(default_factory=lambda: datetime.now(timezone.utc).date().isoformat())
+    purchase_date: str  # filled in by stamp_new_item
     cost_per_unit: Optional[float] = None
     supplier: Optional[str] = None
     location: Optional[str] = None
     description: Optional[str] = None
     status: str = "active"  # "active", "expired", "low_stock", "out_of_stock"
     min_quantity_threshold: int = 10
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: str
+    updated_at: str
+    
+    @model_validator(mode="before")
+    @classmethod
+    def stamp_new_item(cls, data):
+        """Fill missing dates from a single clock read so they agree"""
+        if isinstance(data, dict) and not {"purchase_date", "created_at", "updated_at"} <= data.keys():
+            now = datetime.now(timezone.utc)
+            now_iso = now.isoformat()
+            data = {"purchase_date": now.date().isoformat(), "created_at": now_iso, "updated_at": now_iso, **data}
+        return data
 
 class InventoryItemCreate(BaseModel):
     name: str
@@ -76,6 +111,40 @@ class InventoryItemUpdate(BaseModel):
     status: Optional[str] = None
     min_quantity_threshold: Optional[int] = None
 
+class BulkDeleteRequest(BaseModel):
+    ids: List[str]
+
+class SeedItem(InventoryItemCreate):
+    id: str  # Fixed id, so tests can target seeded rows directly
+
+class InventoryItemSummary(BaseModel):
+    id: str
+    name: str
+    category: str
+    quantity: int
+    unit: str
+    manufacturer: Optional[str] = None
+    expiry_date: Optional[str] = None
+    location: Optional[str] = None
+    status: str = "active"
+    min_quantity_threshold: int = 10
+    created_at: str
+
+# Fields returned by list endpoints, matching InventoryItemSummary
+SUMMARY_PROJECTION = {"_id": 0, **{field: 1 for field in InventoryItemSummary.model_fields}}
+
+# Fields returned by single-item endpoints, matching InventoryItem
+ITEM_PROJECTION = {"_id": 0, **{field: 1 for field in InventoryItem.model_fields}}
+
+class InventoryPage(BaseModel):
+    items: List[InventoryItemSummary]
+    next_cursor: Optional[str] = None  # `created_at|id` of the last item, pass back as `cursor`
+
+class AlertSummary(BaseModel):
+    low_stock: int
+    expired: int
+    expiring_soon: int
+
 class DashboardStats(BaseModel):
     total_items: int
     low_stock_items: int
@@ -85,18 +154,21 @@ class DashboardStats(BaseModel):
     categories: dict
 
 # Helper functions
+# The only fields that may carry date values; everything else is a plain string or number
+DATE_FIELDS = ("expiry_date", "purchase_date")
+
 def prepare_for_mongo(data):
     """Prepare data for MongoDB storage"""
-    if isinstance(data, dict):
-        # Convert date objects to ISO strings if needed
-        for key, value in data.items():
-            if isinstance(value, date):
-                data[key] = value.isoformat()
+    # Convert date objects to ISO strings if needed
+    for key in DATE_FIELDS:
+        value = data.get(key)
+        if isinstance(value, date):
+            data[key] = value.isoformat()
     return data
 
-def check_item_status(item):
+def check_item_status(item, today=None):
     """Check and update item status based on quantity and expiry"""
-    current_date = date.today()
+    current_date = today or date.today()
     
     # Check if expired
     if item.get('expiry_date'):
@@ -107,7 +179,7 @@ def check_item_status(item):
             elif (expiry - current_date).days <= 30:  # Expiring within 30 days
                 if item['quantity'] <= item.get('min_quantity_threshold', 10):
                     return "low_stock"
-        except:
+        except (TypeError, ValueError):
             pass
     
     # Check stock levels
@@ -118,6 +190,178 @@ def check_item_status(item):
     
     return "active"
 
+def new_item_document(item, today=None):
+    """Build a new item and the document to store for it"""
+    new_item = InventoryItem(**item.dict())
+    item_data = new_item.dict()
+    new_item.status = item_data["status"] = check_item_status(item_data, today)
+    
+    item_data = prepare_for_mongo(item_data)
+    item_data["is_low_stock"] = is_low_stock(item_data)
+    item_data["name_key"] = name_key(item_data["name"])
+    return new_item, item_data
+
+def name_key(name):
+    """Case-folded name, stored so prefix search can use a case-sensitive, indexed match"""
+    return name.casefold()
+
+def is_low_stock(item):
+    """Materialized low-stock flag, so the check can be served from an index"""
+    return item['quantity'] <= item.get('min_quantity_threshold', 10)
+
+def expired_query(current_date):
+    """Filter for items whose expiry date has passed.
+    
+    The UI stores an empty string when no expiry date is entered, and `""`
+    sorts before every ISO date, so the lower bound keeps undated items out.
+    """
+    return {"expiry_date": {"$gt": "", "$lt": current_date}}
+
+def status_sweep_ops(today):
+    """Bulk updates that bring stored statuses in line with `check_item_status`.
+    
+    The filters are mutually exclusive and each one skips documents that
+    already carry the target status, so repeated sweeps write nothing.
+    """
+    current_date = today.isoformat()
+    future_date = (today + timedelta(days=30)).isoformat()
+    now = datetime.now(timezone.utc).isoformat()
+    
+    expired = expired_query(current_date)
+    low = {"$expr": {"$lte": ["$quantity", "$min_quantity_threshold"]}}
+    expiring_and_low = {"expiry_date": {"$gte": current_date, "$lte": future_date}, **low}
+    
+    targets = {
+        "expired": expired,
+        "low_stock": {
+            "$nor": [expired],
+            "$or": [expiring_and_low, {"quantity": {"$gt": 0}, **low}]
+        },
+        "out_of_stock": {
+            "quantity": {"$lte": 0},
+            "$nor": [expired, expiring_and_low]
+        },
+        "active": {
+            "quantity": {"$gt": 0},
+            "$expr": {"$gt": ["$quantity", "$min_quantity_threshold"]},
+            "$nor": [expired]
+        }
+    }
+    return [
+        UpdateMany(
+            {**query, "status": {"$ne": status}},
+            {"$set": {"status": status, "updated_at": now}}
+        )
+        for status, query in targets.items()
+    ]
+
+def alert_queries(today):
+    """Filters for each alert category, keyed by the name used in responses"""
+    current_date = today.isoformat()
+    future_date = (today + timedelta(days=30)).isoformat()
+    
+    return {
+        # Stored statuses cover every non-expired item under its threshold
+        "low_stock": {"status": {"$in": ["low_stock", "out_of_stock"]}},
+        "expired": expired_query(current_date),
+        "expiring_soon": {"expiry_date": {"$gte": current_date, "$lte": future_date}}
+    }
+
+def facet_count(facet, name):
+    """Extract a `$count` result from a `$facet` sub-pipeline"""
+    bucket = facet.get(name)
+    return bucket[0]["count"] if bucket else 0
+
+async def fetch_page(query, limit, cursor=None):
+    """Fetch one page of items, newest first, keyed on `created_at` with `id` breaking ties"""
+    if cursor:
+        created_at, _, last_id = cursor.partition("|")
+        if last_id:
+            # Items sharing the boundary timestamp continue after the last id seen
+            query["$or"] = [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "id": {"$lt": last_id}}
+            ]
+        else:
+            query["created_at"] = {"$lt": created_at}
+    
+    # Fetch one extra item to find out whether another page exists
+    items = await db.inventory.find(query, SUMMARY_PROJECTION).sort(
+        [("created_at", -1), ("id", -1)]
+    ).limit(limit + 1).to_list(length=None)
+    if len(items) > limit:
+        last = items[limit - 1]
+        next_cursor = f"{last['created_at']}|{last['id']}"
+    else:
+        next_cursor = None
+    return {"items": items[:limit], "next_cursor": next_cursor}
+
+def invalidate_stats():
+    """Drop cached dashboard stats after a write"""
+    global stats_generation
+    stats_generation += 1
+    stats_cache.clear()
+
+# Startup
+@app.on_event("startup")
+async def create_indexes():
+    """Create indexes used by the list, alert and dashboard queries"""
+    await db.inventory.create_index([("id", 1)], unique=True)
+    await db.inventory.create_index([("category", 1), ("status", 1), ("created_at", -1), ("id", -1)])
+    await db.inventory.create_index([("created_at", -1), ("id", -1)])
+    await db.inventory.create_index([("status", 1)])
+    await db.inventory.create_index([("expiry_date", 1)], sparse=True)
+    await db.inventory.create_index([("is_low_stock", 1)])
+    await db.inventory.create_index([("name_key", 1)])
+    await db.inventory.create_index(
+        [("name", "text"), ("manufacturer", "text"), ("description", "text"), ("batch_number", "text")],
+        default_language="russian"
+    )
+    
+    # Backfill the low-stock flag for documents written before it existed
+    await db.inventory.update_many(
+        {"is_low_stock": {"$exists": False}},
+        [{"$set": {"is_low_stock": {"$lte": ["$quantity", "$min_quantity_threshold"]}}}]
+    )
+    
+    # Backfill the name search key here, since Mongo's $toLower only folds ASCII
+    missing = db.inventory.find({"name_key": {"$exists": False}}, {"_id": 1, "name": 1})
+    backfill = [
+        UpdateOne({"_id": doc["_id"]}, {"$set": {"name_key": name_key(doc.get("name") or "")}})
+        async for doc in missing
+    ]
+    if backfill:
+        await db.inventory.bulk_write(backfill, ordered=False)
+
+async def sweep_item_statuses():
+    """Refresh stored statuses in a single bulk write"""
+    # The sweep filters are disjoint, so the server may apply them in any order
+    await db.inventory.bulk_write(status_sweep_ops(date.today()), ordered=False)
+
+async def status_sweeper():
+    """Periodically refresh stored statuses so reads can return them as-is"""
+    while True:
+        try:
+            await sweep_item_statuses()
+        except Exception as e:
+            print(f"Status sweep failed: {e}")
+        await asyncio.sleep(STATUS_SWEEP_INTERVAL)
+
+@app.on_event("startup")
+async def start_status_sweeper():
+    """Start the background status sweeper"""
+    app.state.status_sweeper = asyncio.create_task(status_sweeper())
+
+@app.on_event("shutdown")
+async def stop_status_sweeper():
+    """Stop the background status sweeper"""
+    app.state.status_sweeper.cancel()
+
+@app.on_event("shutdown")
+async def close_mongo_client():
+    """Close the MongoDB connection pool"""
+    client.close()
+
 # API Routes
 @app.get("/")
 async def root():
@@ -127,138 +371,150 @@ async def root():
 @app.get("/api/dashboard/stats", response_model=DashboardStats)
 async def get_dashboard_stats():
     """Get dashboard statistics"""
+    stats = stats_cache.get("stats")
+    if stats is not None:
+        return stats
+    
+    # Only one request recomputes on a cold cache, the rest wait for its result
+    async with stats_lock:
+        stats = stats_cache.get("stats")
+        if stats is None:
+            generation = stats_generation
+            stats = await compute_dashboard_stats()
+            # A write during the computation may not be reflected, so don't cache it
+            if generation == stats_generation:
+                stats_cache["stats"] = stats
+    return stats
+
+async def compute_dashboard_stats():
+    """Compute dashboard statistics from the inventory collection"""
+    today = date.today()
+    current_date = today.isoformat()
+    future_date = (today + timedelta(days=30)).isoformat()
+    
+    # Compute all counters in a single pass over the collection
     pipeline = [
         {
-            "$group": {
-                "_id": None,
-                "total_items": {"$sum": 1},
-                "total_quantity": {"$sum": "$quantity"},
-                "total_value": {"$sum": {"$multiply": ["$quantity", {"$ifNull": ["$cost_per_unit", 0]}]}},
-                "categories": {"$push": "$category"}
+            "$facet": {
+                "totals": [
+                    {
+                        "$group": {
+                            "_id": None,
+                            "total_value": {"$sum": {"$multiply": ["$quantity", {"$ifNull": ["$cost_per_unit", 0]}]}}
+                        }
+                    }
+                ],
+                "by_category": [
+                    {"$group": {"_id": "$category", "count": {"$sum": 1}}}
+                ],
+                "expired": [
+                    {"$match": expired_query(current_date)},
+                    {"$count": "count"}
+                ],
+                "expiring_soon": [
+                    {"$match": {"expiry_date": {"$gte": current_date, "$lte": future_date}}},
+                    {"$count": "count"}
+                ]
             }
         }
     ]
     
-    result = await db.inventory.aggregate(pipeline).to_list(1)
-    
-    if not result:
-        return DashboardStats(
-            total_items=0,
-            low_stock_items=0,
-            expired_items=0,
-            expiring_soon_items=0,
-            total_value=0.0,
-            categories={}
-        )
-    
-    stats = result[0]
-    
-    # Get status counts
-    current_date = date.today().isoformat()
-    
-    # Count low stock items
-    low_stock_count = await db.inventory.count_documents({
-        "$expr": {"$lte": ["$quantity", "$min_quantity_threshold"]}
-    })
-    
-    # Count expired items
-    expired_count = await db.inventory.count_documents({
-        "expiry_date": {"$lt": current_date},
-        "expiry_date": {"$ne": None}
-    })
-    
-    # Count items expiring in next 30 days
-    from datetime import timedelta
-    future_date = (date.today() + timedelta(days=30)).isoformat()
-    expiring_soon_count = await db.inventory.count_documents({
-        "expiry_date": {"$gte": current_date, "$lte": future_date},
-        "expiry_date": {"$ne": None}
-    })
+    # The unfiltered total comes from collection metadata instead of a scan.
+    # It may briefly drift from the real count after an unclean shutdown,
+    # which is acceptable for a dashboard counter.
+    # The low-stock count runs outside the $facet, where it can use the is_low_stock index.
+    result, total_items, low_stock_items = await asyncio.gather(
+        db.inventory.aggregate(pipeline).to_list(1),
+        db.inventory.estimated_document_count(),
+        db.inventory.count_documents({"is_low_stock": True})
+    )
+    stats = result[0] if result else {}
     
-    # Count by categories
-    category_counts = {}
-    for category in stats.get('categories', []):
-        category_counts[category] = category_counts.get(category, 0) + 1
+    totals = stats.get("totals") or [{}]
+    category_counts = {c["_id"]: c["count"] for c in stats.get("by_category", [])}
     
     return DashboardStats(
-        total_items=stats.get('total_items', 0),
-        low_stock_items=low_stock_count,
-        expired_items=expired_count,
-        expiring_soon_items=expiring_soon_count,
-        total_value=stats.get('total_value', 0.0),
+        total_items=total_items,
+        low_stock_items=low_stock_items,
+        expired_items=facet_count(stats, "expired"),
+        expiring_soon_items=facet_count(stats, "expiring_soon"),
+        total_value=totals[0].get("total_value", 0.0),
         categories=category_counts
     )
 
 # Inventory CRUD operations
-@app.get("/api/inventory", response_model=List[InventoryItem])
-async def get_inventory(category: Optional[str] = None, status: Optional[str] = None):
-    """Get all inventory items with optional filtering"""
+# List endpoints return raw projected documents; the models below only document them
+@app.get("/api/inventory", response_model=None, responses={200: {"model": InventoryPage}})
+async def get_inventory(
+    category: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None
+):
+    """Get a page of inventory items with optional filtering"""
     query = {}
     if category:
         query["category"] = category
     if status:
         query["status"] = status
     
-    items = await db.inventory.find(query).sort("created_at", -1).to_list(length=None)
-    
-    # Update status for each item
-    for item in items:
-        new_status = check_item_status(item)
-        if item.get('status') != new_status:
-            await db.inventory.update_one(
-                {"id": item["id"]},
-                {"$set": {"status": new_status, "updated_at": datetime.now(timezone.utc).isoformat()}}
-            )
-            item['status'] = new_status
-    
-    return [InventoryItem(**item) for item in items]
+    return ORJSONResponse(await fetch_page(query, limit, cursor))
 
 # Search and filtering - MUST be before {item_id} route to avoid conflicts
-@app.get("/api/inventory/search", response_model=List[InventoryItem])
-async def search_inventory(q: str):
-    """Search inventory items by name, manufacturer, or description"""
-    query = {
-        "$or": [
-            {"name": {"$regex": q, "$options": "i"}},
-            {"manufacturer": {"$regex": q, "$options": "i"}},
-            {"description": {"$regex": q, "$options": "i"}},
-            {"batch_number": {"$regex": q, "$options": "i"}}
-        ]
-    }
+@app.get("/api/inventory/search", response_model=None, responses={200: {"model": InventoryPage}})
+async def search_inventory(q: str, limit: int = Query(50, ge=1, le=200), cursor: Optional[str] = None):
+    """Search inventory items by name, manufacturer, description, or batch number"""
+    # Whole words go through the text index
+    if len(q) >= 3:
+        page = await fetch_page({"$text": {"$search": q}}, limit, cursor)
+        if page["items"]:
+            return ORJSONResponse(page)
     
-    items = await db.inventory.find(query).sort("created_at", -1).to_list(length=None)
-    return [InventoryItem(**item) for item in items]
+    # Short or partial terms fall back to a name prefix match
+    # An anchored, case-sensitive regex on the folded name gets tight index bounds
+    name_prefix = {"name_key": {"$regex": f"^{re.escape(name_key(q))}"}}
+    return ORJSONResponse(await fetch_page(name_prefix, limit, cursor))
 
-@app.get("/api/inventory/{item_id}", response_model=InventoryItem)
+@app.get("/api/inventory/{item_id}", response_model=None, responses={200: {"model": InventoryItem}})
 async def get_inventory_item(item_id: str):
     """Get a specific inventory item"""
-    item = await db.inventory.find_one({"id": item_id})
+    item = await db.inventory.find_one({"id": item_id}, ITEM_PROJECTION)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     
-    # Update status
-    new_status = check_item_status(item)
-    if item.get('status') != new_status:
-        await db.inventory.update_one(
-            {"id": item_id},
-            {"$set": {"status": new_status, "updated_at": datetime.now(timezone.utc).isoformat()}}
-        )
-        item['status'] = new_status
-    
-    return InventoryItem(**item)
+    # Stored documents come from our own write path, so return them without re-validation
+    return ORJSONResponse(item)
 
 @app.post("/api/inventory", response_model=InventoryItem)
 async def create_inventory_item(item: InventoryItemCreate):
     """Create a new inventory item"""
-    new_item = InventoryItem(**item.dict())
-    new_item.status = check_item_status(new_item.dict())
-    
-    item_data = prepare_for_mongo(new_item.dict())
+    new_item, item_data = new_item_document(item)
     await db.inventory.insert_one(item_data)
+    invalidate_stats()
     
     return new_item
 
-@app.put("/api/inventory/{item_id}", response_model=InventoryItem)
+@app.post("/api/inventory/bulk", response_model=List[InventoryItem])
+async def create_inventory_items(items: List[InventoryItemCreate]):
+    """Create several inventory items in one request"""
+    today = date.today()
+    built = [new_item_document(item, today) for item in items]
+    if built:
+        await db.inventory.insert_many([item_data for _, item_data in built])
+        invalidate_stats()
+    
+    return [new_item for new_item, _ in built]
+
+@app.post("/api/inventory/bulk_delete")
+async def delete_inventory_items(request: BulkDeleteRequest):
+    """Delete several inventory items in one request"""
+    result = await db.inventory.delete_many({"id": {"$in": request.ids}})
+    if result.deleted_count:
+        invalidate_stats()
+    
+    return {"deleted_count": result.deleted_count}
+
+@app.put("/api/inventory/{item_id}", response_model=None, responses={200: {"model": InventoryItem}})
 async def update_inventory_item(item_id: str, item_update: InventoryItemUpdate):
     """Update an inventory item"""
     existing_item = await db.inventory.find_one({"id": item_id})
@@ -271,14 +527,21 @@ async def update_inventory_item(item_id: str, item_update: InventoryItemUpdate):
     # Update status based on new data
     updated_item = {**existing_item, **update_data}
     update_data["status"] = check_item_status(updated_item)
+    update_data["is_low_stock"] = is_low_stock(updated_item)
+    if "name" in update_data:
+        update_data["name_key"] = name_key(update_data["name"])
     
-    await db.inventory.update_one(
+    updated_item = await db.inventory.find_one_and_update(
         {"id": item_id},
-        {"$set": prepare_for_mongo(update_data)}
+        {"$set": prepare_for_mongo(update_data)},
+        projection=ITEM_PROJECTION,
+        return_document=ReturnDocument.AFTER
     )
+    if not updated_item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    invalidate_stats()
     
-    updated_item = await db.inventory.find_one({"id": item_id})
-    return InventoryItem(**updated_item)
+    return ORJSONResponse(updated_item)
 
 @app.delete("/api/inventory/{item_id}")
 async def delete_inventory_item(item_id: str):
@@ -286,39 +549,61 @@ async def delete_inventory_item(item_id: str):
     result = await db.inventory.delete_one({"id": item_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Item not found")
+    invalidate_stats()
     
     return {"message": "Item deleted successfully"}
 
 # Alerts and notifications
 @app.get("/api/alerts")
-async def get_alerts():
-    """Get alerts for low stock, expired, and expiring items"""
-    current_date = date.today().isoformat()
-    future_date = (date.today() + timedelta(days=30)).isoformat()
-    
-    # Low stock alerts
-    low_stock_items = await db.inventory.find({
-        "$expr": {"$lte": ["$quantity", "$min_quantity_threshold"]},
-        "status": {"$ne": "expired"}
-    }).to_list(length=None)
-    
-    # Expired items
-    expired_items = await db.inventory.find({
-        "expiry_date": {"$lt": current_date},
-        "expiry_date": {"$ne": None}
-    }).to_list(length=None)
-    
-    # Items expiring soon
-    expiring_items = await db.inventory.find({
-        "expiry_date": {"$gte": current_date, "$lte": future_date},
-        "expiry_date": {"$ne": None}
-    }).to_list(length=None)
+async def get_alerts(limit: int = Query(50, ge=1, le=200)):
+    """Get alerts for low stock, expired, and expiring items (up to `limit` of each)"""
+    queries = alert_queries(date.today())
     
-    return {
-        "low_stock": [InventoryItem(**item) for item in low_stock_items],
-        "expired": [InventoryItem(**item) for item in expired_items],
-        "expiring_soon": [InventoryItem(**item) for item in expiring_items]
-    }
+    lists = await asyncio.gather(*(
+        db.inventory.find(query, SUMMARY_PROJECTION).limit(limit).to_list(length=None)
+        for query in queries.values()
+    ))
+    
+    return ORJSONResponse(dict(zip(queries, lists)))
+
+@app.get("/api/alerts/summary", response_model=AlertSummary)
+async def get_alerts_summary():
+    """Get the number of items in each alert category"""
+    queries = alert_queries(date.today())
+    pipeline = [
+        {"$facet": {kind: [{"$match": query}, {"$count": "count"}] for kind, query in queries.items()}}
+    ]
+    
+    result = await db.inventory.aggregate(pipeline).to_list(1)
+    counts = result[0] if result else {}
+    return AlertSummary(**{kind: facet_count(counts, kind) for kind in queries})
+
+# MUST be after /api/alerts/summary to avoid conflicts
+@app.get("/api/alerts/{kind}", response_model=None, responses={200: {"model": InventoryPage}})
+async def get_alerts_by_kind(kind: str, limit: int = Query(20, ge=1, le=200), cursor: Optional[str] = None):
+    """Get a page of items for a single alert category"""
+    queries = alert_queries(date.today())
+    if kind not in queries:
+        raise HTTPException(status_code=404, detail="Unknown alert type")
+    
+    return ORJSONResponse(await fetch_page(queries[kind], limit, cursor))
+
+# Test support
+async def reset_test_data(items: List[SeedItem]):
+    """Replace the given seed rows with fresh copies"""
+    # Only the seeded ids are touched, so other data in the collection survives
+    today = date.today()
+    built = [new_item_document(item, today) for item in items]
+    await db.inventory.delete_many({"id": {"$in": [item.id for item in items]}})
+    if built:
+        await db.inventory.insert_many([item_data for _, item_data in built])
+    invalidate_stats()
+    
+    return [new_item for new_item, _ in built]
+
+# Registered only on test deployments, so the route is absent from the API and its docs elsewhere
+if ENABLE_TEST_ENDPOINTS:
+    app.post("/api/test/reset", response_model=List[InventoryItem])(reset_test_data)
 
 if __name__ == "__main__":
     import uvicorn
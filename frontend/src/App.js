@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import './App.css';
 
 const API_BASE = process.env.REACT_APP_BACKEND_URL;
@@ -6,9 +6,13 @@ const API_BASE = process.env.REACT_APP_BACKEND_URL;
 function App() {
   const [activeTab, setActiveTab] = useState('dashboard');
   const [inventory, setInventory] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [stats, setStats] = useState(null);
   const [alerts, setAlerts] = useState(null);
+  const [alertCounts, setAlertCounts] = useState(null);
   const [loading, setLoading] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const loadingMoreRef = useRef(false);
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedCategory, setSelectedCategory] = useState('');
   const [showAddModal, setShowAddModal] = useState(false);
@@ -39,15 +43,21 @@ function App() {
     }
   };
 
-  const fetchInventory = async () => {
+  // Pages are appended when a cursor is given, otherwise the list is replaced
+  const showPage = (data, cursor) => {
+    setInventory((prev) => (cursor ? [...prev, ...data.items] : data.items));
+    setNextCursor(data.next_cursor);
+  };
+
+  const fetchInventory = async (cursor = null) => {
     try {
-      setLoading(true);
-      const url = selectedCategory 
-        ? `${API_BASE}/api/inventory?category=${selectedCategory}`
-        : `${API_BASE}/api/inventory`;
-      const response = await fetch(url);
+      if (!cursor) setLoading(true);
+      const params = new URLSearchParams();
+      if (selectedCategory) params.set('category', selectedCategory);
+      if (cursor) params.set('cursor', cursor);
+      const response = await fetch(`${API_BASE}/api/inventory?${params}`);
       const data = await response.json();
-      setInventory(data);
+      showPage(data, cursor);
     } catch (error) {
       console.error('Error fetching inventory:', error);
     } finally {
@@ -55,26 +65,48 @@ function App() {
     }
   };
 
+  // Only one "load more" request at a time, so the same page is never appended twice.
+  // The ref also catches a second click that lands before the button re-renders disabled.
+  const loadMore = async () => {
+    if (loadingMoreRef.current) return;
+    loadingMoreRef.current = true;
+    setLoadingMore(true);
+    try {
+      await (searchTerm ? searchInventory(searchTerm, nextCursor) : fetchInventory(nextCursor));
+    } finally {
+      loadingMoreRef.current = false;
+      setLoadingMore(false);
+    }
+  };
+
+  // Counts come first and cheaply, then a short preview of each alert list
   const fetchAlerts = async () => {
     try {
-      const response = await fetch(`${API_BASE}/api/alerts`);
-      const data = await response.json();
-      setAlerts(data);
+      const response = await fetch(`${API_BASE}/api/alerts/summary`);
+      setAlertCounts(await response.json());
+
+      const kinds = ['low_stock', 'expired', 'expiring_soon'];
+      const pages = await Promise.all(
+        kinds.map((kind) => fetch(`${API_BASE}/api/alerts/${kind}?limit=20`).then((r) => r.json()))
+      );
+      setAlerts(Object.fromEntries(kinds.map((kind, i) => [kind, pages[i].items])));
     } catch (error) {
       console.error('Error fetching alerts:', error);
     }
   };
 
-  const searchInventory = async (term) => {
+  const searchInventory = async (term, cursor = null) => {
     if (!term.trim()) {
       fetchInventory();
       return;
     }
     try {
-      setLoading(true);
-      const response = await fetch(`${API_BASE}/api/inventory/search?q=${encodeURIComponent(term)}`);
+      if (!cursor) setLoading(true);
+      const params = new URLSearchParams({ q: term });
+      if (cursor) params.set('cursor', cursor);
+      const response = await fetch(`${API_BASE}/api/inventory/search?${params}`);
       const data = await response.json();
-      setInventory(data);
+      showPage(data, cursor);
     } catch (error) {
       console.error('Error searching inventory:', error);
     } finally {
@@ -119,7 +151,21 @@ function App() {
     }
   };
 
-  const handleEdit = (item) => {
+  const handleEdit = async (summary) => {
+    // List endpoints return a summary, so load the full record for the form.
+    // Editing from the summary would save its missing fields as blanks.
+    let item;
+    try {
+      const response = await fetch(`${API_BASE}/api/inventory/${summary.id}`);
+      if (!response.ok) {
+        throw new Error(`Status ${response.status}`);
+      }
+      item = await response.json();
+    } catch (error) {
+      console.error('Error fetching item:', error);
+      window.alert('Не удалось загрузить элемент для редактирования. Попробуйте ещё раз.');
+      return;
+    }
     setEditingItem(item);
     setFormData({
       name: item.name || '',
@@ -302,15 +348,15 @@ function App() {
       )}
 
       {/* Alerts Section */}
-      {alerts && (
+      {alertCounts && (
         <div className="grid grid-cols-1 lg:grid-cols-3 gap-6">
           {/* Low Stock Alerts */}
           <div className="cyber-card p-6">
             <h3 className="text-lg font-semibold text-yellow-400 mb-4 flex items-center">
-              ⚠️ Заканчиваются ({alerts.low_stock?.length || 0})
+              ⚠️ Заканчиваются ({alertCounts.low_stock || 0})
             </h3>
             <div className="space-y-3 max-h-64 overflow-y-auto">
-              {alerts.low_stock?.map((item) => (
+              {alerts?.low_stock?.map((item) => (
                 <div key={item.id} className="flex justify-between items-center p-3 bg-yellow-500/10 rounded-lg border border-yellow-500/20">
                   <div>
                     <p className="font-medium text-white text-sm">{item.name}</p>
@@ -325,10 +371,10 @@ function App() {
           {/* Expired Alerts */}
           <div className="cyber-card p-6">
             <h3 className="text-lg font-semibold text-red-400 mb-4 flex items-center">
-              🚫 Просрочены ({alerts.expired?.length || 0})
+              🚫 Просрочены ({alertCounts.expired || 0})
             </h3>
             <div className="space-y-3 max-h-64 overflow-y-auto">
-              {alerts.expired?.map((item) => (
+              {alerts?.expired?.map((item) => (
                 <div key={item.id} className="flex justify-between items-center p-3 bg-red-500/10 rounded-lg border border-red-500/20">
                   <div>
                     <p className="font-medium text-white text-sm">{item.name}</p>
@@ -343,10 +389,10 @@ function App() {
           {/* Expiring Soon Alerts */}
           <div className="cyber-card p-6">
             <h3 className="text-lg font-semibold text-orange-400 mb-4 flex items-center">
-              ⏰ Скоро истекут ({alerts.expiring_soon?.length || 0})
+              ⏰ Скоро истекут ({alertCounts.expiring_soon || 0})
             </h3>
             <div className="space-y-3 max-h-64 overflow-y-auto">
-              {alerts.expiring_soon?.map((item) => (
+              {alerts?.expiring_soon?.map((item) => (
                 <div key={item.id} className="flex justify-between items-center p-3 bg-orange-500/10 rounded-lg border border-orange-500/20">
                   <div>
                     <p className="font-medium text-white text-sm">{item.name}</p>
@@ -470,6 +516,18 @@ function App() {
         </div>
       )}
 
+      {nextCursor && !loading && (
+        <div className="text-center">
+          <button
+            onClick={loadMore}
+            disabled={loadingMore}
+            className="cyber-button-secondary px-6 py-2 rounded-lg"
+          >
+            {loadingMore ? 'Загрузка...' : 'Показать ещё'}
+          </button>
+        </div>
+      )}
+
       {inventory.length === 0 && !loading && (
         <div className="text-center py-12">
           <div className="text-4xl mb-4">📦</div>
@@ -0,0 +1,93 @@
+import importlib
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+import server  # noqa: E402
+
+
+class FakeInventory:
+    """Records the collection calls made by the reset route"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def delete_many(self, query):
+        self.calls.append(("delete_many", query))
+
+    async def insert_many(self, documents):
+        self.calls.append(("insert_many", documents))
+
+
+@pytest.fixture
+def load_server(monkeypatch):
+    """Re-import the server with ENABLE_TEST_ENDPOINTS set to the given value"""
+
+    def load(flag):
+        monkeypatch.setenv("ENABLE_TEST_ENDPOINTS", flag)
+        return importlib.reload(server)
+
+    yield load
+    monkeypatch.delenv("ENABLE_TEST_ENDPOINTS")
+    importlib.reload(server)
+
+
+def test_reset_route_is_absent_without_flag(load_server):
+    """Without the flag the reset route is not registered or documented"""
+    app_module = load_server("0")
+    client = TestClient(app_module.app)
+
+    assert client.post("/api/test/reset", json=[]).status_code == 404
+    assert client.post("/api/test/reset", json={"not": "a list"}).status_code == 404
+    assert "/api/test/reset" not in app_module.app.openapi()["paths"]
+
+
+def test_reset_route_replaces_seed_rows(load_server, monkeypatch):
+    """With the flag set the route deletes and re-inserts exactly the posted ids"""
+    app_module = load_server("1")
+    inventory = FakeInventory()
+    monkeypatch.setattr(app_module, "db", SimpleNamespace(inventory=inventory))
+    generation = app_module.stats_generation
+
+    seed = [{"id": "5eed0001", "name": "Бинт", "category": "consumable", "quantity": 3, "unit": "шт"}]
+    response = TestClient(app_module.app).post("/api/test/reset", json=seed)
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == ["5eed0001"]
+    assert inventory.calls[0] == ("delete_many", {"id": {"$in": ["5eed0001"]}})
+    assert [doc["id"] for doc in inventory.calls[1][1]] == ["5eed0001"]
+    assert app_module.stats_generation == generation + 1
+
+
+def _matches_bounds(value, bounds):
+    """Evaluate `$gt`/`$lt` bounds the way Mongo orders strings"""
+    return value > bounds["$gt"] and value < bounds["$lt"]
+
+
+def test_sweep_does_not_expire_undated_items():
+    """The sweep's expired filter skips the "" the UI stores for no expiry date"""
+    today = server.date(2026, 3, 1)
+    expired_op = server.status_sweep_ops(today)[0]
+    bounds = expired_op._filter["expiry_date"]
+
+    assert server.check_item_status({"expiry_date": "", "quantity": 5}, today) != "expired"
+    assert not _matches_bounds("", bounds)
+    assert _matches_bounds("2026-02-28", bounds)
+    assert not _matches_bounds("2026-03-01", bounds)
+
+
+def test_expired_alerts_share_the_sweep_bound():
+    """Alerts count expired items with the same filter the sweep uses"""
+    today = server.date(2026, 3, 1)
+
+    assert server.alert_queries(today)["expired"] == server.expired_query("2026-03-01")
+
+
+def test_name_key_folds_cyrillic_case():
+    """Prefix search keys match regardless of the case the name was typed in"""
+    assert server.name_key("Шприцы одноразовые").startswith(server.name_key("шПРИЦ"))